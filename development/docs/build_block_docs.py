@@ -1,7 +1,8 @@
 import json
 import os
-import re
-from typing import Dict, List, Set, Tuple, Type
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple, Type
 
 from inference.core.utils.file_system import dump_text_lines, read_text_file
 from inference.core.workflows.entities.base import OutputDefinition
@@ -13,7 +14,7 @@ from inference.core.workflows.execution_engine.introspection.connections_discove
     discover_blocks_connections,
 )
 from inference.core.workflows.execution_engine.introspection.entities import (
-    SelectorDefinition, BlockDescription,
+    SelectorDefinition, BlockDescription, BlockManifestMetadata,
 )
 from inference.core.workflows.execution_engine.introspection.schema_parser import (
     parse_block_manifest_schema,
@@ -91,6 +92,8 @@ KIND_PAGE_TEMPLATE = """
 {details}
 """
 
+KIND_NAME_SEPARATORS = frozenset("[] ")
+
 
 def main() -> None:
     os.makedirs(BLOCK_DOCUMENTATION_DIRECTORY, exist_ok=True)
@@ -113,6 +116,7 @@ def main() -> None:
         blocks_description=blocks_description
     )
     generated_kinds_index_lines = []
+    documentation_pages = []
     for declared_kind in blocks_description.declared_kinds:
         description = (
             declared_kind.description
@@ -132,8 +136,7 @@ def main() -> None:
             f"* [`{declared_kind.name}`]({relative_link}): {description}\n"
         )
         kind_file_path = build_kind_page_path(kind_name=declared_kind.name)
-        with open(kind_file_path, "w") as documentation_file:
-            documentation_file.write(kind_page)
+        documentation_pages.append((kind_file_path, kind_page))
     kinds_index_lines = read_text_file(
         path=KINDS_DOCUMENTATION_FILE,
         split_lines=True,
@@ -160,16 +163,18 @@ def main() -> None:
         short_description = block.block_schema.get("short_description", "")
         long_description = block.block_schema.get("long_description", "")
 
-        documentation_file_name = camel_to_snake(block.manifest_type_identifier) + ".md"
+        block_slug = camel_to_snake(block.manifest_type_identifier)
+        documentation_file_name = f"{block_slug}.md"
         documentation_file_path = os.path.join(
             BLOCK_DOCUMENTATION_DIRECTORY, documentation_file_name
         )
         example_definition = generate_example_step_definition(block=block)
+        parsed_schema = parse_block_manifest_schema(schema=block.block_schema)
         documentation_content = BLOCK_DOCUMENTATION_TEMPLATE.format(
             class_name=block.manifest_type_identifier,
             description=long_description,
-            block_inputs=format_block_inputs(block.block_schema),
-            block_input_bindings=format_input_bindings(block.block_schema),
+            block_inputs=format_block_inputs(parsed_schema=parsed_schema),
+            block_input_bindings=format_input_bindings(parsed_schema=parsed_schema),
             block_output_bindings=format_block_outputs(block.outputs_manifest),
             input_connections=format_block_connections(
                 connections=blocks_connections.input_connections.block_wise[
@@ -185,16 +190,16 @@ def main() -> None:
             ),
             example="\n\t".join(json.dumps(example_definition, indent=4).split("\n")),
         )
-        with open(documentation_file_path, "w") as documentation_file:
-            documentation_file.write(documentation_content)
+        documentation_pages.append((documentation_file_path, documentation_content))
         block_card_line = BLOCK_CARD_TEMPLATE.format(
-            data_url=camel_to_snake(block.manifest_type_identifier),
+            data_url=block_slug,
             data_name=block.manifest_type_identifier,
             data_desc=short_description,
             data_labels=", ".join([block_type, block_license]),
             data_authors="",
         )
         block_card_lines.append(block_card_line)
+    save_documentation_pages(pages=documentation_pages)
 
     lines = lines[: start_index + 1] + block_card_lines + lines[end_index:]
     dump_text_lines(
@@ -209,8 +214,9 @@ def get_auto_generation_markers(
     documentation_lines: List[str],
     token: str,
 ) -> Tuple[int, int]:
+    # looking for one token more than expected is enough to detect surplus
     lines_with_token_indexes = search_lines_with_token(
-        lines=documentation_lines, token=token
+        lines=documentation_lines, token=token, max_occurrences=3
     )
     if len(lines_with_token_indexes) != 2:
         raise RuntimeError(
@@ -220,33 +226,86 @@ def get_auto_generation_markers(
     return lines_with_token_indexes[0], lines_with_token_indexes[-1]
 
 
-def search_lines_with_token(lines: List[str], token: str) -> List[int]:
+def search_lines_with_token(
+    lines: List[str], token: str, max_occurrences: Optional[int] = None
+) -> List[int]:
     result = []
     for line_index, line in enumerate(lines):
         if token in line:
             result.append(line_index)
+            if max_occurrences is not None and len(result) >= max_occurrences:
+                break
     return result
 
 
+def save_documentation_pages(pages: List[Tuple[str, str]]) -> None:
+    paths = [path for path, _ in pages]
+    contents = [content for _, content in pages]
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(save_documentation_page, paths, contents))
+
+
+def save_documentation_page(path: str, content: str) -> None:
+    serialised_content = content.encode("utf-8")
+    if is_file_content_up_to_date(path=path, content=serialised_content):
+        return
+    with open(path, "wb") as documentation_file:
+        documentation_file.write(serialised_content)
+
+
+def is_file_content_up_to_date(path: str, content: bytes) -> bool:
+    try:
+        if os.stat(path).st_size != len(content):
+            return False
+    except FileNotFoundError:
+        return False
+    with open(path, "rb") as f:
+        return f.read() == content
+
+
 def build_kind_page_path(kind_name: str) -> str:
     kind_file_name = f"{slugify_kind_name(kind_name=kind_name)}.md"
     return os.path.join(KINDS_DOCUMENTATION_DIRECTORY, kind_file_name)
 
 
+@lru_cache(maxsize=None)
 def slugify_kind_name(kind_name: str) -> str:
-    kind_name = re.sub(r"[\[\] ]+", r"_", kind_name.lower())
-    kind_name = camel_to_snake(name=kind_name)
-    return kind_name.strip("_")
-
-
+    # lower-cased name has no camel-case boundaries left, so it is enough
+    # to collapse each run of separator characters into single "_"
+    result = []
+    previous_char_is_separator = False
+    for char in kind_name.lower():
+        char_is_separator = char in KIND_NAME_SEPARATORS
+        if not char_is_separator:
+            result.append(char)
+        elif not previous_char_is_separator:
+            result.append("_")
+        previous_char_is_separator = char_is_separator
+    return "".join(result).strip("_")
+
+
+@lru_cache(maxsize=None)
 def camel_to_snake(name: str) -> str:
-    name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    name = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name)
-    return name.lower()
-
-
-def format_block_inputs(block_schema: dict) -> str:
-    parsed_schema = parse_block_manifest_schema(schema=block_schema)
+    # single pass equivalent of inserting "_" before upper-case letters that
+    # start a capitalised word (OCRModel -> ocr_model) or follow a lower-case
+    # letter / digit (modelV2 -> model_v2)
+    result = []
+    last_index = len(name) - 1
+    for index, char in enumerate(name):
+        if index > 0 and "A" <= char <= "Z":
+            previous_char = name[index - 1]
+            starts_word = index < last_index and "a" <= name[index + 1] <= "z"
+            if (
+                starts_word
+                or "a" <= previous_char <= "z"
+                or "0" <= previous_char <= "9"
+            ):
+                result.append("_")
+        result.append(char.lower())
+    return "".join(result)
+
+
+def format_block_inputs(parsed_schema: BlockManifestMetadata) -> str:
     rows = []
     for input_description in parsed_schema.primitive_types.values():
         ref_appear = input_description.property_name in parsed_schema.selectors
@@ -257,8 +316,7 @@ def format_block_inputs(block_schema: dict) -> str:
     return "\n".join(USER_CONFIGURATION_HEADER + rows)
 
 
-def format_input_bindings(block_schema: dict) -> str:
-    parsed_schema = parse_block_manifest_schema(schema=block_schema)
+def format_input_bindings(parsed_schema: BlockManifestMetadata) -> str:
     rows = []
     for selector in parsed_schema.selectors.values():
         kinds_annotation = prepare_selector_kinds_annotation(selector=selector)
@@ -278,7 +336,7 @@ def prepare_selector_kinds_annotation(selector: SelectorDefinition) -> str:
             relative_link = f"/workflows/kinds/{slugify_kind_name(kind_name=kind.name)}"
             type_string = f"[`{kind.name}`]({relative_link})"
             type_annotation_chunks.add(type_string)
-    type_annotation_str = ", ".join(type_annotation_chunks)
+    type_annotation_str = ", ".join(sorted(type_annotation_chunks))
     if len(type_annotation_chunks) > 1:
         return f"Union[{type_annotation_str}]"
     return type_annotation_str
@@ -318,12 +376,12 @@ def format_block_connections(
 ) -> str:
     if len(connections) == 0:
         return "None"
+    connections_identifiers = sorted(
+        block_type2manifest_type_identifier[connection] for connection in connections
+    )
     connections = [
-        (
-            f"[`{block_type2manifest_type_identifier[connection]}`]"
-            f"(/workflows/blocks/{camel_to_snake(block_type2manifest_type_identifier[connection])})"
-        )
-        for connection in connections
+        f"[`{identifier}`](/workflows/blocks/{camel_to_snake(identifier)})"
+        for identifier in connections_identifiers
     ]
     return ", ".join(connections)
 
@@ -10,9 +10,10 @@ def read_text_file(
 ) -> Union[str, List[str]]:
     with open(path) as f:
         if split_lines:
-            lines = list(f.readlines())
+            lines = f.readlines()
             if strip_white_chars:
-                return [line.strip() for line in lines if len(line.strip()) > 0]
+                stripped_lines = (line.strip() for line in lines)
+                return [line for line in stripped_lines if len(line) > 0]
             else:
                 return lines
         content = f.read()
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict, List, Literal, Tuple, Type, Union
 
 import numpy as np
@@ -41,6 +42,8 @@ the RelativeStaticCrop block to crop objects, then an OCR block to run character
 recognition on each of the individual cropped regions.
 """
 
+IN_MEMORY_IMAGE_TYPES = {ImageType.NUMPY_OBJECT.value, ImageType.PILLOW.value}
+
 
 class BlockManifest(WorkflowBlockManifest):
     model_config = ConfigDict(
@@ -105,32 +108,49 @@ class RelativeStaticCropBlock(WorkflowBlock):
         width: float,
         height: float,
     ) -> Union[List[Dict[str, Any]], Tuple[List[Dict[str, Any]], FlowControl]]:
-        decoded_images = [load_image(e) for e in images]
-        decoded_images = [
-            i[0] if i[1] is True else i[0][:, :, ::-1] for i in decoded_images
-        ]
+        if any(is_image_decoding_required(image=e) for e in images):
+            decoded_images = await asyncio.get_running_loop().run_in_executor(
+                None, list, map(load_image, images)
+            )
+        else:
+            decoded_images = [load_image(e) for e in images]
+        images_are_bgr = [i[1] is True for i in decoded_images]
+        decoded_images = [i[0] for i in decoded_images]
         images_parents = [i[PARENT_ID_KEY] for i in images]
         origin_image_shape = extract_origin_size_from_images_batch(
             input_images=images,
             decoded_images=decoded_images,
         )
+        crops_coordinates = calculate_static_crops_coordinates(
+            images_shapes=[i.shape[:2] for i in decoded_images],
+            x_center=x_center,
+            y_center=y_center,
+            width=width,
+            height=height,
+        )
         crops = [
-            take_static_crop(
+            build_static_crop(
                 image=i,
-                x_center=x_center,
-                y_center=y_center,
-                width=width,
-                height=height,
+                crop_coordinates=coordinates,
                 origin_size=size,
                 image_parent=image_parent,
             )
-            for i, image_parent, size in zip(
-                decoded_images, images_parents, origin_image_shape
+            for i, coordinates, image_parent, size in zip(
+                decoded_images, crops_coordinates, images_parents, origin_image_shape
             )
         ]
+        for crop, is_bgr in zip(crops, images_are_bgr):
+            if not is_bgr:
+                crop[IMAGE_VALUE_KEY] = crop[IMAGE_VALUE_KEY][:, :, ::-1]
         return [{"crops": c, PARENT_ID_KEY: c[PARENT_ID_KEY]} for c in crops]
 
 
+def is_image_decoding_required(image: Any) -> bool:
+    if not isinstance(image, dict):
+        return not isinstance(image, np.ndarray)
+    return image.get(IMAGE_TYPE_KEY) not in IN_MEMORY_IMAGE_TYPES
+
+
 def take_static_crop(
     image: np.ndarray,
     x_center: float,
@@ -140,14 +160,48 @@ def take_static_crop(
     origin_size: dict,
     image_parent: str,
 ) -> Dict[str, Union[str, np.ndarray]]:
-    x_center = round(image.shape[1] * x_center)
-    y_center = round(image.shape[0] * y_center)
-    width = round(image.shape[1] * width)
-    height = round(image.shape[0] * height)
-    x_min = round(x_center - width / 2)
-    y_min = round(y_center - height / 2)
-    x_max = round(x_min + width)
-    y_max = round(y_min + height)
+    crops_coordinates = calculate_static_crops_coordinates(
+        images_shapes=[image.shape[:2]],
+        x_center=x_center,
+        y_center=y_center,
+        width=width,
+        height=height,
+    )
+    return build_static_crop(
+        image=image,
+        crop_coordinates=crops_coordinates[0],
+        origin_size=origin_size,
+        image_parent=image_parent,
+    )
+
+
+def calculate_static_crops_coordinates(
+    images_shapes: List[Tuple[int, int]],
+    x_center: float,
+    y_center: float,
+    width: float,
+    height: float,
+) -> np.ndarray:
+    images_shapes = np.array(images_shapes, dtype=np.int64).reshape(-1, 2)
+    images_heights, images_widths = images_shapes[:, 0], images_shapes[:, 1]
+    crops_x_centers = np.rint(images_widths * x_center)
+    crops_y_centers = np.rint(images_heights * y_center)
+    crops_widths = np.rint(images_widths * width)
+    crops_heights = np.rint(images_heights * height)
+    x_min = np.rint(crops_x_centers - crops_widths / 2)
+    y_min = np.rint(crops_y_centers - crops_heights / 2)
+    x_max = x_min + crops_widths
+    y_max = y_min + crops_heights
+    return np.stack([x_min, y_min, x_max, y_max], axis=1).astype(np.int64)
+
+
+def build_static_crop(
+    image: np.ndarray,
+    crop_coordinates: np.ndarray,
+    origin_size: dict,
+    image_parent: str,
+) -> Dict[str, Union[str, np.ndarray]]:
+    x_min, y_min, x_max, y_max = crop_coordinates.tolist()
     cropped_image = image[y_min:y_max, x_min:x_max]
     return {
         IMAGE_TYPE_KEY: ImageType.NUMPY_OBJECT.value,
@@ -1,6 +1,13 @@
+import base64
+
+import cv2
 import numpy as np
+import pytest
+from PIL import Image
 
 from inference.core.workflows.core_steps.transformations.relative_static_crop import (
+    RelativeStaticCropBlock,
+    calculate_static_crops_coordinates,
     take_static_crop,
 )
 
@@ -33,3 +40,116 @@ def test_take_relative_static_crop() -> None:
         "left_top_y": 50,
         "origin_image_size": {"height": 100, "width": 100},
     }, "Origin coordinates of crop and image size metadata must be preserved through the operation"
+
+
+def test_calculate_static_crops_coordinates_for_batch_of_images() -> None:
+    # when
+    result = calculate_static_crops_coordinates(
+        images_shapes=[(100, 100), (200, 50)],
+        x_center=0.5,
+        y_center=0.6,
+        width=0.1,
+        height=0.2,
+    )
+
+    # then
+    assert result.tolist() == [
+        [45, 50, 55, 70],
+        [22, 100, 27, 140],
+    ], "Coordinates must be calculated independently for each image in batch"
+
+
+@pytest.mark.asyncio
+async def test_run_relative_static_crop_step_when_rgb_and_bgr_images_given() -> None:
+    # given
+    bgr_image = np.zeros((100, 100, 3), dtype=np.uint8)
+    bgr_image[50:70, 45:55] = (10, 20, 30)
+    rgb_image = np.zeros((100, 100, 3), dtype=np.uint8)
+    rgb_image[50:70, 45:55] = (30, 20, 10)
+    block = RelativeStaticCropBlock()
+
+    # when
+    result = await block.run_locally(
+        images=[
+            {"type": "numpy_object", "value": bgr_image, "parent_id": "bgr_parent"},
+            {
+                "type": "pil",
+                "value": Image.fromarray(rgb_image),
+                "parent_id": "rgb_parent",
+            },
+        ],
+        x_center=0.5,
+        y_center=0.6,
+        width=0.1,
+        height=0.2,
+    )
+
+    # then
+    expected_crop = np.zeros((20, 10, 3), dtype=np.uint8)
+    expected_crop[:, :] = (10, 20, 30)
+    assert len(result) == 2, "Expected one crop per input image"
+    assert [r["parent_id"] for r in result] == [
+        "bgr_parent",
+        "rgb_parent",
+    ], "Order of crops must match order of input images"
+    for crop_result in result:
+        crop = crop_result["crops"]
+        assert (
+            crop["value"] == expected_crop
+        ).all(), "Crop must be taken from the right region and be in BGR order"
+        assert crop["origin_coordinates"] == {
+            "left_top_x": 45,
+            "left_top_y": 50,
+            "origin_image_size": {"height": 100, "width": 100},
+        }, "Origin coordinates of crop must be preserved through the operation"
+        assert type(crop["origin_coordinates"]["left_top_x"]) is int
+        assert type(crop["origin_coordinates"]["left_top_y"]) is int
+
+
+@pytest.mark.asyncio
+async def test_run_relative_static_crop_step_when_encoded_image_given() -> None:
+    # given
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    image[50:70, 45:55] = (10, 20, 30)
+    _, encoded_image = cv2.imencode(".png", image)
+    block = RelativeStaticCropBlock()
+
+    # when
+    result = await block.run_locally(
+        images=[
+            {
+                "type": "base64",
+                "value": base64.b64encode(encoded_image.tobytes()).decode("ascii"),
+                "parent_id": "parent",
+            },
+        ],
+        x_center=0.5,
+        y_center=0.6,
+        width=0.1,
+        height=0.2,
+    )
+
+    # then
+    assert len(result) == 1, "Expected one crop per input image"
+    assert (
+        result[0]["crops"]["value"] == image[50:70, 45:55]
+    ).all(), "Crop must be taken from decoded image in BGR order"
+    assert result[0]["parent_id"] == "parent", "Parent id must be preserved"
+
+
+@pytest.mark.asyncio
+async def test_run_relative_static_crop_step_when_empty_batch_given() -> None:
+    # given
+    block = RelativeStaticCropBlock()
+
+    # when
+    result = await block.run_locally(
+        images=[],
+        x_center=0.5,
+        y_center=0.6,
+        width=0.1,
+        height=0.2,
+    )
+
+    # then
+    assert result == [], "Empty batch of images must produce empty batch of crops"